@@ -1,6 +1,12 @@
+import re
+
 from pytz import timezone
 
 TIME_ZONE_KST = timezone("Asia/Seoul")
 
 KOR_BEGIN_CODE = 0xAC00
 KOR_END_CODE = 0xD7AF
+
+KOR_ENG_NUM_PATTERN = re.compile(f'[a-zA-Z\\d{chr(KOR_BEGIN_CODE)}-{chr(KOR_END_CODE)}]*')
+KOR_ENG_NUM_SPACE_PATTERN = re.compile(f'[ a-zA-Z\\d{chr(KOR_BEGIN_CODE)}-{chr(KOR_END_CODE)}]*')
+INSTAGRAM_NAME_PATTERN = re.compile(f'[_.a-zA-Z\\d{chr(KOR_BEGIN_CODE)}-{chr(KOR_END_CODE)}]*')
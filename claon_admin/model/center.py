@@ -3,11 +3,15 @@ from typing import List
 
 from pydantic import BaseModel, validator
 
-from claon_admin.common.consts import KOR_BEGIN_CODE, KOR_END_CODE
+from claon_admin.common.consts import KOR_ENG_NUM_SPACE_PATTERN, INSTAGRAM_NAME_PATTERN
 from claon_admin.common.enum import WallType, PeriodType, CenterFeeType, CenterMemberSearchOrder, CenterMemberStatus
 from claon_admin.model.user import UserProfileDto
 from claon_admin.schema.center import Center, CenterHold, CenterWall, CenterFee
 
+TIME_PATTERN = re.compile(r'^(0\d|1\d|2[0-3]):(0[1-9]|[0-5]\d)$')
+TEL_PATTERN = re.compile(r'^(0)\d{1,2}-\d{3,4}-\d{4}$')
+DAYS_OF_WEEK = frozenset(('월', '화', '수', '목', '금', '토', '일', '공휴일'))
+
 
 class CenterOperatingTimeDto(BaseModel):
     day_of_week: str
@@ -16,19 +20,19 @@ class CenterOperatingTimeDto(BaseModel):
 
     @validator('day_of_week')
     def validate_day_of_week(cls, value):
-        if value not in ['월', '화', '수', '목', '금', '토', '일', '공휴일']:
+        if value not in DAYS_OF_WEEK:
             raise ValueError('요일은 월, 화, 수, 목, 금, 토, 일 중 하나로 입력해 주세요.')
         return value
 
     @validator('start_time')
     def validate_start_time(cls, value):
-        if not re.match(r'^(0\d|1\d|2[0-3]):(0[1-9]|[0-5]\d)$', value):
+        if not TIME_PATTERN.match(value):
             raise ValueError('올바른 시간 형식으로 입력해 주세요.')
         return value
 
     @validator('end_time')
     def validate_end_time(cls, value):
-        if not re.match(r'^(0\d|1\d|2[0-3]):(0[1-9]|[0-5]\d)$', value):
+        if not TIME_PATTERN.match(value):
             raise ValueError('올바른 시간 형식으로 입력해 주세요.')
         return value
 
@@ -178,17 +182,15 @@ class CenterCoreCreateRequestDto(BaseModel):
 
     @validator('name')
     def validate_name(cls, value):
-        for c in value:
-            if not ((c == ' ') or ('a' <= c <= 'z') or ('A' <= c <= 'Z') or (
-                    KOR_BEGIN_CODE <= ord(c) <= KOR_END_CODE) or c.isdigit()):
-                raise ValueError('암장명은 한글, 영문, 숫자로만 입력해 주세요.')
+        if not KOR_ENG_NUM_SPACE_PATTERN.fullmatch(value):
+            raise ValueError('암장명은 한글, 영문, 숫자로만 입력해 주세요.')
         if len(value) < 2 or len(value) > 50:
             raise ValueError('암장명은 2자 이상 50자 이하로 입력해 주세요.')
         return value
 
     @validator('tel', pre=True, always=True)
     def validate_tel(cls, value):
-        if not re.match(r'^(0)\d{1,2}-\d{3,4}-\d{4}$', value):
+        if not TEL_PATTERN.match(value):
             raise ValueError('전화번호를 올바른 형식으로 다시 입력해주세요.')
         return value
 
@@ -197,10 +199,8 @@ class CenterCoreCreateRequestDto(BaseModel):
         if value is None:
             return value
 
-        for c in value:
-            if not ((c == '_') or (c == '.') or ('a' <= c <= 'z') or ('A' <= c <= 'Z') or (
-                    KOR_BEGIN_CODE <= ord(c) <= KOR_END_CODE) or c.isdigit()):
-                raise ValueError('인스타그램 닉네임은 한글, 영문, 숫자로만 입력해 주세요.')
+        if not INSTAGRAM_NAME_PATTERN.fullmatch(value):
+            raise ValueError('인스타그램 닉네임은 한글, 영문, 숫자로만 입력해 주세요.')
         if len(value) < 3 or len(value) > 30:
             raise ValueError('인스타그램 닉네임은 3자 이상 30자 이하로 입력해 주세요.')
         return value
@@ -241,7 +241,7 @@ class CenterCoreUpdateRequestDto(BaseModel):
 
     @validator('tel', pre=True, always=True)
     def validate_tel(cls, value):
-        if not re.match(r'^(0)\d{1,2}-\d{3,4}-\d{4}$', value):
+        if not TEL_PATTERN.match(value):
             raise ValueError('전화번호를 올바른 형식으로 다시 입력해주세요.')
         return value
 
@@ -250,10 +250,8 @@ class CenterCoreUpdateRequestDto(BaseModel):
         if value is None:
             return value
 
-        for c in value:
-            if not ((c == '_') or (c == '.') or ('a' <= c <= 'z') or ('A' <= c <= 'Z') or (
-                    KOR_BEGIN_CODE <= ord(c) <= KOR_END_CODE) or c.isdigit()):
-                raise ValueError('인스타그램 닉네임은 한글, 영문, 숫자로만 입력해 주세요.')
+        if not INSTAGRAM_NAME_PATTERN.fullmatch(value):
+            raise ValueError('인스타그램 닉네임은 한글, 영문, 숫자로만 입력해 주세요.')
         if len(value) < 3 or len(value) > 30:
             raise ValueError('인스타그램 닉네임은 3자 이상 30자 이하로 입력해 주세요.')
         return value
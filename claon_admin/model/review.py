@@ -1,6 +1,5 @@
-from collections import Counter
 from datetime import date
-from typing import List, Tuple
+from typing import List, Tuple, Dict
 
 from pydantic import BaseModel, validator, root_validator
 
@@ -26,7 +25,7 @@ class ReviewAnswerResponseDto(BaseModel):
 
     @classmethod
     def from_entity(cls, entity: ReviewAnswer):
-        return cls(
+        return cls.construct(
             review_answer_id=entity.id,
             content=entity.content,
             created_at=get_relative_time(entity.created_at),
@@ -48,7 +47,7 @@ class ReviewBriefResponseDto(BaseModel):
     @classmethod
     def from_entity(cls, entity: Tuple[Review, int]):
         review, visit_count = entity
-        return cls(
+        return cls.construct(
             review_id=review.id,
             content=review.content,
             created_at=get_relative_time(review.created_at),
@@ -75,8 +74,8 @@ class ReviewSummaryResponseDto(BaseModel):
     count_by_tag: List[ReviewTagDto]
 
     @classmethod
-    def from_entity(cls, center: Center, counts: Counter, count_by_tag: List[ReviewTagDto]):
-        return cls(
+    def from_entity(cls, center: Center, counts: Dict[bool, int], count_by_tag: List[ReviewTagDto]):
+        return cls.construct(
             center_id=center.id,
             center_name=center.name,
             count_total=counts[False] + counts[True],
@@ -3,7 +3,7 @@ from typing import List
 
 from pydantic import BaseModel, validator, EmailStr
 
-from claon_admin.common.consts import KOR_BEGIN_CODE, KOR_END_CODE
+from claon_admin.common.consts import KOR_ENG_NUM_PATTERN, KOR_ENG_NUM_SPACE_PATTERN, INSTAGRAM_NAME_PATTERN
 from claon_admin.common.enum import Role
 from claon_admin.schema.center import Center
 from claon_admin.schema.user import Lector, User
@@ -43,20 +43,16 @@ class UserProfileDto(BaseModel):
 
     @validator('nickname')
     def validate_nickname(cls, value):
-        for c in value:
-            if not (('a' <= c <= 'z') or ('A' <= c <= 'Z') or (
-                    KOR_BEGIN_CODE <= ord(c) <= KOR_END_CODE) or c.isdigit()):
-                raise ValueError('닉네임은 한글, 영문, 숫자로만 입력해 주세요.')
+        if not KOR_ENG_NUM_PATTERN.fullmatch(value):
+            raise ValueError('닉네임은 한글, 영문, 숫자로만 입력해 주세요.')
         if len(value) < 2 or len(value) > 20:
             raise ValueError('닉네임은 2자 이상 20자 이하로 입력해 주세요.')
         return value
 
     @validator('instagram_nickname')
     def validate_instagram_nickname(cls, value):
-        for c in value:
-            if not ((c == '_') or (c == '.') or ('a' <= c <= 'z') or ('A' <= c <= 'Z') or (
-                    KOR_BEGIN_CODE <= ord(c) <= KOR_END_CODE) or c.isdigit()):
-                raise ValueError('인스타그램 닉네임은 한글, 영문, 숫자 및 유효 특수문자로만 입력해 주세요.')
+        if not INSTAGRAM_NAME_PATTERN.fullmatch(value):
+            raise ValueError('인스타그램 닉네임은 한글, 영문, 숫자 및 유효 특수문자로만 입력해 주세요.')
         if value is not None and (len(value) < 3 or len(value) > 30):
             raise ValueError('인스타그램 닉네임은 3자 이상 30자 이하로 입력해 주세요.')
         return value
@@ -88,20 +84,16 @@ class LectorContestDto(BaseModel):
 
     @validator('title')
     def validate_title(cls, value):
-        for c in value:
-            if not ((c == ' ') or ('a' <= c <= 'z') or ('A' <= c <= 'Z') or (
-                    KOR_BEGIN_CODE <= ord(c) <= KOR_END_CODE) or c.isdigit()):
-                raise ValueError('수상명은 한글, 영문, 숫자로만 입력해 주세요.')
+        if not KOR_ENG_NUM_SPACE_PATTERN.fullmatch(value):
+            raise ValueError('수상명은 한글, 영문, 숫자로만 입력해 주세요.')
         if len(value) < 1 or len(value) > 50:
             raise ValueError('수상명은 50자 이하로 입력해 주세요.')
         return value
 
     @validator('name')
     def validate_name(cls, value):
-        for c in value:
-            if not ((c == ' ') or ('a' <= c <= 'z') or ('A' <= c <= 'Z') or (
-                    KOR_BEGIN_CODE <= ord(c) <= KOR_END_CODE) or c.isdigit()):
-                raise ValueError('대회명은 한글, 영문, 숫자로만 입력해 주세요.')
+        if not KOR_ENG_NUM_SPACE_PATTERN.fullmatch(value):
+            raise ValueError('대회명은 한글, 영문, 숫자로만 입력해 주세요.')
         if len(value) < 1 or len(value) > 50:
             raise ValueError('대회명은 50자 이하로 입력해 주세요.')
         return value
@@ -120,10 +112,8 @@ class LectorCertificateDto(BaseModel):
 
     @validator('name')
     def validate_name(cls, value):
-        for c in value:
-            if not ((c == ' ') or ('a' <= c <= 'z') or ('A' <= c <= 'Z') or (
-                    KOR_BEGIN_CODE <= ord(c) <= KOR_END_CODE) or c.isdigit()):
-                raise ValueError('자격증명은 한글, 영문, 숫자로만 입력 해주세요.')
+        if not KOR_ENG_NUM_SPACE_PATTERN.fullmatch(value):
+            raise ValueError('자격증명은 한글, 영문, 숫자로만 입력 해주세요.')
         if len(value) < 1 or len(value) > 50:
             raise ValueError('자격증명은 50자 이하로 입력 해주세요.')
         return value
@@ -136,10 +126,8 @@ class LectorCareerDto(BaseModel):
 
     @validator('name')
     def validate_name(cls, value):
-        for c in value:
-            if not ((c == ' ') or ('a' <= c <= 'z') or ('A' <= c <= 'Z') or (
-                    KOR_BEGIN_CODE <= ord(c) <= KOR_END_CODE) or c.isdigit()):
-                raise ValueError('경력명은 한글, 영문, 숫자로만 입력해 주세요.')
+        if not KOR_ENG_NUM_SPACE_PATTERN.fullmatch(value):
+            raise ValueError('경력명은 한글, 영문, 숫자로만 입력해 주세요.')
         if len(value) < 1 or len(value) > 50:
             raise ValueError('경력명은 50자 이하로 입력해 주세요.')
         return value
@@ -2,6 +2,7 @@ from typing import List
 
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, UploadFile, File
+from fastapi.responses import ORJSONResponse
 from fastapi_pagination import Params
 from fastapi_utils.cbv import cbv
 
@@ -101,7 +102,9 @@ class CenterRouter:
                                    params: Params = Depends()):
         return await self.post_service.find_posts_by_center(subject, params, center_id, finder)
 
-    @router.get('/{center_id}/reviews', response_model=Pagination[ReviewBriefResponseDto])
+    @router.get('/{center_id}/reviews',
+                response_model=Pagination[ReviewBriefResponseDto],
+                response_class=ORJSONResponse)
     async def find_reviews_by_center(self,
                                      subject: CenterAdminUser,
                                      center_id: str,
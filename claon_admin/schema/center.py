@@ -6,9 +6,9 @@ from uuid import uuid4
 from fastapi_pagination import Params
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy import String, Column, ForeignKey, Boolean, select, exists, Integer, Enum, delete, and_, desc, func, \
-    null, DateTime
+    null, DateTime, case
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import relationship, selectinload, backref
+from sqlalchemy.orm import relationship, selectinload, joinedload, backref
 from sqlalchemy.dialects.postgresql import TEXT
 
 from claon_admin.common.enum import PeriodType, CenterFeeType
@@ -257,16 +257,19 @@ class Review(Base):
 
     @property
     def tag(self):
-        if self._tag is None:
-            return []
-
-        values = json.loads(self._tag)
-        return [ReviewTag(value['word']) for value in values]
+        return Review.parse_tag(self._tag)
 
     @tag.setter
     def tag(self, values: List[ReviewTag]):
         self._tag = json.dumps([value.__dict__ for value in values], default=str)
 
+    @staticmethod
+    def parse_tag(value: str | None):
+        if value is None:
+            return []
+
+        return [ReviewTag(tag['word']) for tag in json.loads(value)]
+
 
 class ReviewAnswer(Base):
     id = Column(String(length=255), primary_key=True, default=lambda: str(uuid4()))
@@ -316,6 +319,12 @@ class CenterRepository(Repository[Center]):
                                        .options(selectinload(Center.fees)))
         return result.scalars().one_or_none()
 
+    async def exists_and_owned_by(self, session: AsyncSession, center_id: str, user_id: str):
+        result = await session.execute(select(case((Center.user_id == user_id, True), else_=False))
+                                       .where(Center.id == center_id))
+        is_owner = result.scalars().one_or_none()
+        return None if is_owner is None else bool(is_owner)
+
     async def exists_by_name_and_approved(self, session: AsyncSession, name: str):
         result = await session.execute(select(exists().where(Center.name == name).where(Center.approved.is_(True))))
         return result.scalar()
@@ -419,13 +428,28 @@ class ReviewRepository(Repository[Review]):
     async def find_by_id_and_center_id(self, session: AsyncSession, review_id: str, center_id: str):
         result = await session.execute(select(Review)
                                        .where(and_(Review.center_id == center_id, Review.id == review_id))
-                                       .options(selectinload(Review.answer)))
+                                       .options(joinedload(Review.answer)))
         return result.scalars().one_or_none()
 
-    async def find_all_by_center(self, session: AsyncSession, center_id: str):
-        result = await session.execute(select(Review).where(Review.center_id == center_id))
-
-        return result.scalars().all()
+    async def count_by_center_group_by_answered(self, session: AsyncSession, center_id: str):
+        is_answered = Review.answer_id.is_not(None)
+        query_result = await session.execute(select(is_answered, func.count(Review.id))
+                                             .where(Review.center_id == center_id)
+                                             .group_by(is_answered))
+
+        counts = {True: 0, False: 0}
+        for answered, count in query_result.fetchall():
+            counts[bool(answered)] = count
+        return counts
+
+    async def count_tags_by_center(self, session: AsyncSession, center_id: str):
+        result = await session.execute(select(Review._tag).where(Review.center_id == center_id))
+
+        counts = {}
+        for tags in result.scalars().all():
+            for tag in Review.parse_tag(tags):
+                counts[tag.word] = counts.get(tag.word, 0) + 1
+        return counts
 
 
 class ReviewAnswerRepository(Repository[ReviewAnswer]):
@@ -1,5 +1,3 @@
-from collections import Counter
-
 from fastapi_pagination import Params
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -28,18 +26,7 @@ class ReviewService:
                                      params: Params,
                                      center_id: str,
                                      finder: ReviewFinder):
-        center = await self.center_repository.find_by_id(session, center_id)
-        if center is None:
-            raise NotFoundException(
-                ErrorCode.DATA_DOES_NOT_EXIST,
-                "해당 암장이 존재하지 않습니다."
-            )
-
-        if not center.is_owner(subject.id):
-            raise UnauthorizedException(
-                ErrorCode.NOT_ACCESSIBLE,
-                "암장 관리자가 아닙니다."
-            )
+        await self._validate_center_owner(session, subject, center_id)
 
         pages = await self.review_repository.find_reviews_by_center(
             session,
@@ -60,25 +47,7 @@ class ReviewService:
                                    center_id: str,
                                    review_id: str,
                                    req: ReviewAnswerRequestDto):
-        center = await self.center_repository.find_by_id(session, center_id)
-        if center is None:
-            raise NotFoundException(
-                ErrorCode.DATA_DOES_NOT_EXIST,
-                "해당 암장이 존재하지 않습니다."
-            )
-
-        if not center.is_owner(subject.id):
-            raise UnauthorizedException(
-                ErrorCode.NOT_ACCESSIBLE,
-                "암장 관리자가 아닙니다."
-            )
-
-        review = await self.review_repository.find_by_id_and_center_id(session, review_id, center.id)
-        if review is None:
-            raise NotFoundException(
-                ErrorCode.DATA_DOES_NOT_EXIST,
-                "해당 리뷰가 암장에 존재하지 않습니다."
-            )
+        review = await self._find_review_by_center(session, subject, center_id, review_id)
 
         if review.answer is not None:
             raise NotFoundException(
@@ -102,25 +71,7 @@ class ReviewService:
                                    center_id: str,
                                    review_id: str,
                                    req: ReviewAnswerRequestDto):
-        center = await self.center_repository.find_by_id(session, center_id)
-        if center is None:
-            raise NotFoundException(
-                ErrorCode.DATA_DOES_NOT_EXIST,
-                "해당 암장이 존재하지 않습니다."
-            )
-
-        if not center.is_owner(subject.id):
-            raise UnauthorizedException(
-                ErrorCode.NOT_ACCESSIBLE,
-                "암장 관리자가 아닙니다."
-            )
-
-        review = await self.review_repository.find_by_id_and_center_id(session, review_id, center.id)
-        if review is None:
-            raise NotFoundException(
-                ErrorCode.DATA_DOES_NOT_EXIST,
-                "암장에 해당 리뷰가 존재하지 않습니다."
-            )
+        review = await self._find_review_by_center(session, subject, center_id, review_id)
 
         if review.answer is None:
             raise NotFoundException(
@@ -138,25 +89,7 @@ class ReviewService:
                                    subject: RequestUser,
                                    center_id: str,
                                    review_id: str):
-        center = await self.center_repository.find_by_id(session, center_id)
-        if center is None:
-            raise NotFoundException(
-                ErrorCode.DATA_DOES_NOT_EXIST,
-                "해당 암장이 존재하지 않습니다."
-            )
-
-        if not center.is_owner(subject.id):
-            raise UnauthorizedException(
-                ErrorCode.NOT_ACCESSIBLE,
-                "암장 관리자가 아닙니다."
-            )
-
-        review = await self.review_repository.find_by_id_and_center_id(session, review_id, center.id)
-        if review is None:
-            raise NotFoundException(
-                ErrorCode.DATA_DOES_NOT_EXIST,
-                "암장에 해당 리뷰가 존재하지 않습니다."
-            )
+        review = await self._find_review_by_center(session, subject, center_id, review_id)
 
         if review.answer is None:
             raise NotFoundException(
@@ -184,17 +117,41 @@ class ReviewService:
                 "암장 관리자가 아닙니다."
             )
 
-        reviews = await self.review_repository.find_all_by_center(session, center.id)
-
-        is_answer, tags = [], []
-        for review in reviews:
-            is_answer.append(False if review.answer_id is None else True)
-            tags.append(review.tag)
-
-        tag_list = [t.word for t in sum(tags, [])]
+        answer_counter = await self.review_repository.count_by_center_group_by_answered(session, center.id)
+        tag_counter = await self.review_repository.count_tags_by_center(session, center.id)
 
         return ReviewSummaryResponseDto.from_entity(
             center,
-            Counter(is_answer),
-            [ReviewTagDto(tag=tag, count=count) for tag, count in Counter(tag_list).items()]
+            answer_counter,
+            [ReviewTagDto(tag=tag, count=count) for tag, count in tag_counter.items()]
         )
+
+    async def _validate_center_owner(self, session: AsyncSession, subject: RequestUser, center_id: str):
+        is_owner = await self.center_repository.exists_and_owned_by(session, center_id, subject.id)
+        if is_owner is None:
+            raise NotFoundException(
+                ErrorCode.DATA_DOES_NOT_EXIST,
+                "해당 암장이 존재하지 않습니다."
+            )
+
+        if not is_owner:
+            raise UnauthorizedException(
+                ErrorCode.NOT_ACCESSIBLE,
+                "암장 관리자가 아닙니다."
+            )
+
+    async def _find_review_by_center(self,
+                                     session: AsyncSession,
+                                     subject: RequestUser,
+                                     center_id: str,
+                                     review_id: str):
+        await self._validate_center_owner(session, subject, center_id)
+
+        review = await self.review_repository.find_by_id_and_center_id(session, review_id, center_id)
+        if review is None:
+            raise NotFoundException(
+                ErrorCode.DATA_DOES_NOT_EXIST,
+                "암장에 해당 리뷰가 존재하지 않습니다."
+            )
+
+        return review
@@ -0,0 +1,69 @@
+import pytest
+from pydantic import ValidationError
+
+from claon_admin.model.user import UserProfileDto, LectorCareerDto
+
+
+def user_profile(nickname: str = "nickname", instagram_nickname: str | None = "insta_name"):
+    return UserProfileDto(
+        profile_image="profile_image",
+        nickname=nickname,
+        email="test@test.com",
+        instagram_nickname=instagram_nickname
+    )
+
+
+@pytest.mark.describe("Test case for user profile dto")
+class TestUserProfileDto(object):
+    @pytest.mark.it("Success case: nickname with korean, english and digits")
+    @pytest.mark.parametrize("nickname", ["클라온", "claon", "claon2023", "클라온claon1"])
+    def test_valid_nickname(self, nickname: str):
+        assert user_profile(nickname=nickname).nickname == nickname
+
+    @pytest.mark.it("Fail case: nickname with invalid characters")
+    @pytest.mark.parametrize("nickname", ["claon!", "claon name", "claon\n", "claon²", "ㅋㅋㅋ", "claon_"])
+    def test_invalid_nickname_character(self, nickname: str):
+        with pytest.raises(ValidationError):
+            user_profile(nickname=nickname)
+
+    @pytest.mark.it("Fail case: nickname length out of range")
+    @pytest.mark.parametrize("nickname", ["a", "a" * 21])
+    def test_invalid_nickname_length(self, nickname: str):
+        with pytest.raises(ValidationError):
+            user_profile(nickname=nickname)
+
+    @pytest.mark.it("Success case: instagram nickname with underscore and dot")
+    @pytest.mark.parametrize("instagram_nickname", ["claon_admin", "claon.admin", "클라온_2023", None])
+    def test_valid_instagram_nickname(self, instagram_nickname: str | None):
+        assert user_profile(instagram_nickname=instagram_nickname).instagram_nickname == instagram_nickname
+
+    @pytest.mark.it("Fail case: instagram nickname with invalid characters")
+    @pytest.mark.parametrize("instagram_nickname", ["claon-admin", "claon admin", "claon\n", "claon³"])
+    def test_invalid_instagram_nickname_character(self, instagram_nickname: str):
+        with pytest.raises(ValidationError):
+            user_profile(instagram_nickname=instagram_nickname)
+
+    @pytest.mark.it("Fail case: instagram nickname length out of range")
+    @pytest.mark.parametrize("instagram_nickname", ["ab", "a" * 31])
+    def test_invalid_instagram_nickname_length(self, instagram_nickname: str):
+        with pytest.raises(ValidationError):
+            user_profile(instagram_nickname=instagram_nickname)
+
+
+@pytest.mark.describe("Test case for lector career dto")
+class TestLectorCareerDto(object):
+    @pytest.mark.it("Success case: name with spaces")
+    def test_valid_name(self):
+        assert LectorCareerDto(start_date="2020-01-01", end_date="2021-01-01", name="클라온 강사 1년").name == "클라온 강사 1년"
+
+    @pytest.mark.it("Fail case: name with invalid characters")
+    @pytest.mark.parametrize("name", ["클라온\n강사", "강사!", "강사①"])
+    def test_invalid_name_character(self, name: str):
+        with pytest.raises(ValidationError):
+            LectorCareerDto(start_date="2020-01-01", end_date="2021-01-01", name=name)
+
+    @pytest.mark.it("Fail case: name length out of range")
+    @pytest.mark.parametrize("name", ["", "a" * 51])
+    def test_invalid_name_length(self, name: str):
+        with pytest.raises(ValidationError):
+            LectorCareerDto(start_date="2020-01-01", end_date="2021-01-01", name=name)
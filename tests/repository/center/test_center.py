@@ -65,6 +65,43 @@ class TestCenterRepository(object):
         # then
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_exists_center_and_owned_by_user(
+            self,
+            session: AsyncSession,
+            user_fixture: User,
+            center_fixture: Center
+    ):
+        # when
+        result = await center_repository.exists_and_owned_by(session, center_fixture.id, user_fixture.id)
+
+        # then
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_exists_center_and_not_owned_by_user(
+            self,
+            session: AsyncSession,
+            center_fixture: Center
+    ):
+        # when
+        result = await center_repository.exists_and_owned_by(session, center_fixture.id, "other_user_id")
+
+        # then
+        assert result is False
+
+    @pytest.mark.asyncio
+    async def test_exists_and_owned_by_with_non_existing_center(
+            self,
+            session: AsyncSession,
+            user_fixture: User
+    ):
+        # when
+        result = await center_repository.exists_and_owned_by(session, "non_existing_id", user_fixture.id)
+
+        # then
+        assert result is None
+
     @pytest.mark.asyncio
     async def test_find_center_by_id_with(
             self,
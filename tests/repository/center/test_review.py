@@ -132,7 +132,22 @@ class TestReviewRepository(object):
         ) == review_fixture
 
     @pytest.mark.asyncio
-    async def test_find_review_by_center(
+    async def test_count_by_center_group_by_answered(
+            self,
+            session: AsyncSession,
+            center_fixture: Center,
+            review_fixture: Review,
+            other_review_fixture: Review,
+            review_answer_fixture: ReviewAnswer
+    ):
+        # then
+        assert await review_repository.count_by_center_group_by_answered(
+            session,
+            center_fixture.id
+        ) == {True: 1, False: 1}
+
+    @pytest.mark.asyncio
+    async def test_count_tags_by_center(
             self,
             session: AsyncSession,
             center_fixture: Center,
@@ -140,10 +155,10 @@ class TestReviewRepository(object):
             other_review_fixture: Review
     ):
         # then
-        assert await review_repository.find_all_by_center(
+        assert await review_repository.count_tags_by_center(
             session,
             center_fixture.id
-        ) == [review_fixture, other_review_fixture]
+        ) == {"tag": 1, "tag2": 1, "tag3": 1, "tag4": 1}
 
 
 @pytest.mark.describe("Test case for review answer repository")
@@ -0,0 +1,9 @@
+import pytest
+from sqlalchemy.orm import configure_mappers
+
+from claon_admin.schema import center, membership, post, user
+
+
+@pytest.fixture(scope="session", autouse=True)
+def configure_mappers_fixture():
+    configure_mappers()
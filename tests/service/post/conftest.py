@@ -1,19 +1,27 @@
-import uuid
 from datetime import datetime, timedelta
-from typing import List
+from itertools import count
 from unittest.mock import AsyncMock
 
 import pytest
+from fastapi_pagination import Params, Page
 
-from claon_admin.common.enum import Role, WallType
+from claon_admin.common.enum import Role
 from claon_admin.common.util.time import now
+from claon_admin.model.post import PostBriefResponseDto
 from claon_admin.schema.center import CenterRepository, Center, CenterImage, OperatingTime, Utility, CenterFeeImage, \
-    CenterFee, CenterHold, CenterWall
-from claon_admin.schema.post import PostRepository, Post, PostImage, ClimbingHistory, PostCountHistoryRepository, \
+    CenterFee, CenterHold
+from claon_admin.schema.post import PostRepository, Post, PostImage, PostCountHistoryRepository, \
     PostCountHistory
 from claon_admin.schema.user import User
 from claon_admin.service.post import PostService
 
+id_sequence = count()
+PARAMS = Params(page=1, size=10)
+
+
+def next_id():
+    return f"id-{next(id_sequence)}"
+
 
 @pytest.fixture
 def mock_repo():
@@ -37,10 +45,10 @@ def post_service(mock_repo: dict):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def user_fixture():
     yield User(
-        id=str(uuid.uuid4()),
+        id=next_id(),
         oauth_id="oauth_id",
         nickname="nickname",
         profile_img="profile_img",
@@ -51,10 +59,10 @@ def user_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pending_user_fixture():
     yield User(
-        id=str(uuid.uuid4()),
+        id=next_id(),
         oauth_id="pending_oauth_id",
         nickname="pending_nickname",
         profile_img="pending_profile_img",
@@ -65,10 +73,10 @@ def pending_user_fixture():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def center_fixture(user_fixture: User):
     yield Center(
-        id=str(uuid.uuid4()),
+        id=next_id(),
         user=user_fixture,
         user_id=user_fixture.id,
         name="test center",
@@ -87,11 +95,11 @@ def center_fixture(user_fixture: User):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def center_fees_fixture(center_fixture: Center):
     yield [
         CenterFee(
-            id=str(uuid.uuid4()),
+            id=next_id(),
             center=center_fixture,
             name="fee",
             price=1000,
@@ -100,11 +108,11 @@ def center_fees_fixture(center_fixture: Center):
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def center_holds_fixture(center_fixture: Center):
     yield [
         CenterHold(
-            id=str(uuid.uuid4()),
+            id=next_id(),
             center=center_fixture,
             name="hold",
             difficulty="hard",
@@ -113,22 +121,10 @@ def center_holds_fixture(center_fixture: Center):
     ]
 
 
-@pytest.fixture
-async def center_walls_fixture(center_fixture: Center):
-    yield [
-        CenterWall(
-            id=str(uuid.uuid4()),
-            center=center_fixture,
-            name="wall",
-            type=WallType.ENDURANCE.value
-        )
-    ]
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def post_fixture(user_fixture: User, center_fixture: Center):
     yield Post(
-        id=str(uuid.uuid4()),
+        id=next_id(),
         user=user_fixture,
         center=center_fixture,
         content="content",
@@ -137,10 +133,20 @@ def post_fixture(user_fixture: User, center_fixture: Center):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def post_page_fixture(post_fixture: Post):
+    yield Page(items=[post_fixture], params=PARAMS, total=1, page=1, pages=1)
+
+
+@pytest.fixture(scope="module")
+def post_brief_dto_fixture(post_fixture: Post):
+    yield PostBriefResponseDto.from_entity(post_fixture)
+
+
+@pytest.fixture(scope="module")
 def other_post_fixture(pending_user_fixture: User, center_fixture: Center):
     yield Post(
-        id=str(uuid.uuid4()),
+        id=next_id(),
         user=pending_user_fixture,
         center=center_fixture,
         content="content",
@@ -149,10 +155,10 @@ def other_post_fixture(pending_user_fixture: User, center_fixture: Center):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def another_post_fixture(user_fixture: User, center_fixture: Center):
     yield Post(
-        id=str(uuid.uuid4()),
+        id=next_id(),
         user=user_fixture,
         center=center_fixture,
         content="content",
@@ -161,10 +167,10 @@ def another_post_fixture(user_fixture: User, center_fixture: Center):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def yesterday_post_fixture(user_fixture: User, center_fixture: Center):
     yield Post(
-        id=str(uuid.uuid4()),
+        id=next_id(),
         user=user_fixture,
         center=center_fixture,
         content="content",
@@ -173,10 +179,10 @@ def yesterday_post_fixture(user_fixture: User, center_fixture: Center):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def today_post_fixture(user_fixture: User, center_fixture: Center):
     yield Post(
-        id=str(uuid.uuid4()),
+        id=next_id(),
         user=user_fixture,
         center=center_fixture,
         content="content",
@@ -213,19 +219,3 @@ async def post_count_history_list_fixture(center_fixture: Center):
             reg_date=now().date() - timedelta(days=1)
         )
     ]
-
-
-@pytest.fixture
-def climbing_history_fixture(post_fixture: Post,
-                             center_holds_fixture: List[CenterHold],
-                             center_walls_fixture: List[CenterWall]):
-    yield [
-        ClimbingHistory(
-            id=str(uuid.uuid4()),
-            post=post_fixture,
-            hold_id=center_holds_fixture[0].id,
-            difficulty=center_holds_fixture[0].difficulty,
-            challenge_count=3,
-            wall_name=center_walls_fixture[0].name,
-            wall_type=center_walls_fixture[0].type)
-    ]
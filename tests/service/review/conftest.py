@@ -1,12 +1,10 @@
 import uuid
-from datetime import datetime, timedelta
-from typing import List
+from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
 
 from claon_admin.common.enum import Role
-from claon_admin.common.util.time import now
 from claon_admin.schema.center import CenterRepository, ReviewRepository, ReviewAnswerRepository, Center, CenterImage, \
     OperatingTime, Utility, CenterFeeImage, ReviewAnswer, Review, ReviewTag
 from claon_admin.schema.post import Post, PostImage
@@ -78,52 +76,6 @@ def review_user_fixture():
     )
 
 
-@pytest.fixture
-def review_user_list_fixture():
-    yield [
-        User(
-            id=str(uuid.uuid4()),
-            oauth_id="r1_oauth_id",
-            nickname="r1_nickname",
-            profile_img="r1_profile_img",
-            sns="r1_sns",
-            email="r1_test@test.com",
-            instagram_name="r1_instagram_name",
-            role=Role.USER
-        ),
-        User(
-            id=str(uuid.uuid4()),
-            oauth_id="r2_oauth_id",
-            nickname="r2_nickname",
-            profile_img="r2_profile_img",
-            sns="r2_sns",
-            email="r2_test@test.com",
-            instagram_name="r2_instagram_name",
-            role=Role.USER
-        ),
-        User(
-            id=str(uuid.uuid4()),
-            oauth_id="r3_oauth_id",
-            nickname="r3_nickname",
-            profile_img="r3_profile_img",
-            sns="r3_sns",
-            email="r3_test@test.com",
-            instagram_name="r3_instagram_name",
-            role=Role.USER
-        ),
-        User(
-            id=str(uuid.uuid4()),
-            oauth_id="r4_oauth_id",
-            nickname="r4_nickname",
-            profile_img="r4_profile_img",
-            sns="r4_sns",
-            email="r4_test@test.com",
-            instagram_name="r4_instagram_name",
-            role=Role.USER
-        )
-    ]
-
-
 @pytest.fixture
 def center_fixture(user_fixture: User):
     yield Center(
@@ -260,74 +212,3 @@ def new_review_answer_fixture(review_fixture: Review):
         review=review_fixture,
         created_at=datetime(2023, 2, 7)
     )
-
-
-@pytest.fixture
-def review_answer_list_fixture():
-    yield [
-        ReviewAnswer(
-            id=str(uuid.uuid4()),
-            content="answer1",
-            created_at=now().date() - timedelta(days=1)
-        ),
-        ReviewAnswer(
-            id=str(uuid.uuid4()),
-            content="answer2",
-            created_at=now().date() - timedelta(days=1)
-        ),
-        ReviewAnswer(
-            id=str(uuid.uuid4()),
-            content="answer3",
-            created_at=now().date() - timedelta(days=1)
-        )
-    ]
-
-
-@pytest.fixture
-def review_list_fixture(
-        review_answer_list_fixture: List[ReviewAnswer],
-        review_user_list_fixture: List[User],
-        center_fixture: Center
-):
-    yield [
-        Review(
-            id=str(uuid.uuid4()),
-            user=review_user_list_fixture[0],
-            center=center_fixture,
-            answer_id=review_answer_list_fixture[0].id,
-            answer=review_answer_list_fixture[0],
-            content="content",
-            created_at=datetime(2023, 4, 4),
-            tag=[ReviewTag(word="tag"), ReviewTag(word="tag2")]
-        ),
-        Review(
-            id=str(uuid.uuid4()),
-            user=review_user_list_fixture[1],
-            center=center_fixture,
-            answer_id=review_answer_list_fixture[1].id,
-            answer=review_answer_list_fixture[1],
-            content="content",
-            created_at=datetime(2023, 4, 4),
-            tag=[ReviewTag(word="tag")]
-        ),
-        Review(
-            id=str(uuid.uuid4()),
-            user=review_user_list_fixture[2],
-            center=center_fixture,
-            answer_id=review_answer_list_fixture[2].id,
-            answer=review_answer_list_fixture[2],
-            content="content",
-            created_at=datetime(2023, 4, 4),
-            tag=[ReviewTag(word="tag2"), ReviewTag(word="tag3")]
-        ),
-        Review(
-            id=str(uuid.uuid4()),
-            user=review_user_list_fixture[3],
-            center=center_fixture,
-            answer_id=None,
-            answer=None,
-            content="content",
-            created_at=datetime(2023, 4, 4),
-            tag=[ReviewTag(word="tag"), ReviewTag(word="tag3")]
-        )
-    ]
@@ -24,7 +24,7 @@ class TestCreateReviewAnswer(object):
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
         dto = ReviewAnswerRequestDto(answer_content="new answer")
 
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [True]
         mock_repo["review"].find_by_id_and_center_id.side_effect = [not_answered_review_fixture]
         mock_repo["review_answer"].save.side_effect = [new_review_answer_fixture]
 
@@ -45,7 +45,7 @@ class TestCreateReviewAnswer(object):
     ):
         # given
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [None]
+        mock_repo["center"].exists_and_owned_by.side_effect = [None]
         wrong_id = "wrong id"
         dto = ReviewAnswerRequestDto(answer_content="content")
 
@@ -67,7 +67,7 @@ class TestCreateReviewAnswer(object):
     ):
         # given
         request_user = RequestUser(id="123456", sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [False]
         dto = ReviewAnswerRequestDto(answer_content="content")
 
         with pytest.raises(UnauthorizedException) as exception:
@@ -87,7 +87,7 @@ class TestCreateReviewAnswer(object):
     ):
         # given
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [True]
         mock_repo["review"].find_by_id_and_center_id.side_effect = [None]
         dto = ReviewAnswerRequestDto(answer_content="content")
         wrong_review_id = "wrong id"
@@ -111,7 +111,7 @@ class TestCreateReviewAnswer(object):
     ):
         # given
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [True]
         mock_repo["review"].find_by_id_and_center_id.side_effect = [review_fixture]
         dto = ReviewAnswerRequestDto(answer_content="content")
 
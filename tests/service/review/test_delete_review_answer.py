@@ -21,7 +21,7 @@ class TestDeleteReviewAnswer(object):
     ):
         # given
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [True]
         mock_repo["review"].find_by_id_and_center_id.side_effect = [review_fixture]
         mock_repo["review_answer"].delete.side_effect = [review_answer_fixture]
 
@@ -42,7 +42,7 @@ class TestDeleteReviewAnswer(object):
     ):
         # given
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [None]
+        mock_repo["center"].exists_and_owned_by.side_effect = [None]
         wrong_id = "wrong id"
 
         with pytest.raises(NotFoundException) as exception:
@@ -63,7 +63,7 @@ class TestDeleteReviewAnswer(object):
     ):
         # given
         request_user = RequestUser(id="123456", sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [False]
 
         with pytest.raises(UnauthorizedException) as exception:
             # when
@@ -82,7 +82,7 @@ class TestDeleteReviewAnswer(object):
     ):
         # given
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [True]
         mock_repo["review"].find_by_id_and_center_id.side_effect = [None]
         wrong_review_id = "wrong id"
 
@@ -104,7 +104,7 @@ class TestDeleteReviewAnswer(object):
     ):
         # given
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [True]
         mock_repo["review"].find_by_id_and_center_id.side_effect = [not_answered_review_fixture]
 
         with pytest.raises(NotFoundException) as exception:
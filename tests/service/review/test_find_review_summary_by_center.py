@@ -1,13 +1,10 @@
-from typing import List
-
 import pytest
 
 from claon_admin.common.enum import Role
 from claon_admin.common.error.exception import NotFoundException, ErrorCode, UnauthorizedException
 from claon_admin.model.auth import RequestUser
 from claon_admin.model.review import ReviewTagDto
-from claon_admin.schema.center import Center, Review, ReviewAnswer
-from claon_admin.schema.user import User
+from claon_admin.schema.center import Center
 from claon_admin.service.review import ReviewService
 
 
@@ -19,15 +16,13 @@ class TestFindReviewsSummaryByCenter(object):
             self,
             review_service: ReviewService,
             mock_repo: dict,
-            center_fixture: Center,
-            review_user_list_fixture: List[User],
-            review_list_fixture: List[Review],
-            review_answer_list_fixture: List[ReviewAnswer]
+            center_fixture: Center
     ):
         # given
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
         mock_repo["center"].find_by_id.side_effect = [center_fixture]
-        mock_repo["review"].find_all_by_center.side_effect = [review_list_fixture]
+        mock_repo["review"].count_by_center_group_by_answered.side_effect = [{True: 3, False: 1}]
+        mock_repo["review"].count_tags_by_center.side_effect = [{"tag": 3, "tag2": 2, "tag3": 2}]
         # when
         results = await review_service.find_reviews_summary_by_center(request_user, center_fixture.id)
 
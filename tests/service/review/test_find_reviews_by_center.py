@@ -50,7 +50,7 @@ class TestFindReviewsByCenter(object):
         params = Params(page=1, size=10)
         items = [(review_fixture, 1), (other_review_fixture, 1), (another_review_fixture, 1)]
         review_page = Page(items=items, params=params, total=3, page=1, pages=1)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [True]
         mock_repo["review"].find_reviews_by_center.return_value = review_page
         mock_pagination = Pagination(
             next_page_num=2,
@@ -100,7 +100,7 @@ class TestFindReviewsByCenter(object):
         params = Params(page=1, size=10)
         items = [(other_review_fixture, 1)]
         review_page = Page(items=items, params=params, total=0, page=1, pages=1)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [True]
         mock_repo["review"].find_reviews_by_center.return_value = review_page
         mock_pagination = Pagination(
             next_page_num=2,
@@ -150,7 +150,7 @@ class TestFindReviewsByCenter(object):
         params = Params(page=1, size=10)
         items = [(review_fixture, 1), (another_review_fixture, 1)]
         review_page = Page(items=items, params=params, total=0, page=1, pages=1)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [True]
         mock_repo["review"].find_reviews_by_center.return_value = review_page
         mock_pagination = Pagination(
             next_page_num=2,
@@ -191,7 +191,7 @@ class TestFindReviewsByCenter(object):
     ):
         # given
         request_user = RequestUser(id=center_fixture.user.id, sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [None]
+        mock_repo["center"].exists_and_owned_by.side_effect = [None]
         params = Params(page=1, size=10)
 
         with pytest.raises(NotFoundException) as exception:
@@ -217,7 +217,7 @@ class TestFindReviewsByCenter(object):
     ):
         # given
         request_user = RequestUser(id="123456", sns="test@claon.com", role=Role.CENTER_ADMIN)
-        mock_repo["center"].find_by_id.side_effect = [center_fixture]
+        mock_repo["center"].exists_and_owned_by.side_effect = [False]
         params = Params(page=1, size=10)
 
         with pytest.raises(UnauthorizedException) as exception: